@@ -1,8 +1,10 @@
+import json as jsonlib
 from flask import request
 import requests
 from flask_restx import Resource
 from src.server.app import api
 from src.config import config_data
+from src.upstream import upstream_call
 
 jinaai_ns = api.namespace("jinaai", description="Jina.ai API")
 
@@ -163,12 +165,17 @@ class WeatherLookUpResource(Resource):
             headers["X-With-Links-Summary"] = "true"
         if gather_all_images_at_the_end:
             headers["X-With-Images-Summary"] = "true"
+        params = {"url": api, "headers": dict(headers)}
         if apikey:
             headers["Authorization"] = f"Bearer {apikey}"
 
-        r = requests.get(api, headers=headers)
+        def fetch():
+            r = requests.get(api, headers=headers)
+            return {"status_code": r.status_code, "text": r.text}
+
+        r = upstream_call("jinaai", params, fetch)
         if enable_json_response:
-            result = r.json()
+            result = jsonlib.loads(r["text"])
             code = result.get("code", 200)
             if code != 200:
                 raise Exception(result.get("readableMessage"))
@@ -178,4 +185,4 @@ class WeatherLookUpResource(Resource):
             else:
                 return {"json_result_for_search": data}
         else:
-            return {"markdown_result": r.text}
+            return {"markdown_result": r["text"]}
@@ -4,6 +4,7 @@ from tavily import TavilyClient
 from flask_restx import Resource, fields
 from src.server.app import api
 from src.config import config_data
+from src.upstream import upstream_call
 
 tavily_ns = api.namespace("tavily-ai", description="Tavily AI Api")
 
@@ -337,11 +338,6 @@ class TavilySearch(Resource):
             "response_time": 3.11
         }
         """
-        tavily_apikey = config_data.get("tavily", {}).get("apikey")
-        if not tavily_apikey:
-            raise ValueError("Tavily API key not found in config file")
-        tavily = TavilyClient(api_key=tavily_apikey)
-
         data = request.get_json()
         query = data.get("query")
         
@@ -364,23 +360,33 @@ class TavilySearch(Resource):
         include_raw_content = data.get("include_raw_content", False)
         include_images = data.get("include_images", False)
         
+        params = {
+            "query": query,
+            "search_depth": search_depth,
+            "topic": topic,
+            "days": days,
+            "max_results": max_results,
+            "include_domains": include_domains,
+            "exclude_domains": exclude_domains,
+            "include_answer": include_answer,
+            "include_raw_content": include_raw_content,
+            "include_images": include_images,
+        }
+
+        def fetch():
+            tavily_apikey = config_data.get("tavily", {}).get("apikey")
+            if not tavily_apikey:
+                raise ValueError("Tavily API key not found in config file")
+            tavily = TavilyClient(api_key=tavily_apikey)
+            try:
+                return tavily.search(**params)
+            except HTTPError as e:
+                json = e.response.json()
+                message = json.get("detail", {}).get('error', []);
+                raise Exception(message)
+
         try:
-            response = tavily.search(
-                query=query,
-                search_depth=search_depth,
-                topic=topic,
-                days=days,
-                max_results=max_results,
-                include_domains=include_domains,
-                exclude_domains=exclude_domains,
-                include_answer=include_answer,
-                include_raw_content=include_raw_content,
-                include_images=include_images,
-            )
+            response = upstream_call("tavily", params, fetch)
             return jsonify(response)
-        except HTTPError as e:
-            json = e.response.json()
-            message = json.get("detail", {}).get('error', []);
-            raise Exception(message)
         except Exception as e:
             raise Exception(str(e))
@@ -0,0 +1,96 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from src.config import config_data
+
+upstream_config = config_data.get("upstream", {})
+
+# live: call the real APIs
+# record: call the real APIs and append every exchange to the store
+# replay: serve exchanges from the store, never touching the network
+mode = upstream_config.get("mode", "live")
+if mode not in ("live", "record", "replay"):
+    raise ValueError("Upstream mode should be one of: live, record, replay")
+
+store_path = upstream_config.get("store", "upstream_recordings.jsonl")
+replay_latency = upstream_config.get("replay_latency", False)
+
+_lock = threading.Lock()
+_recordings = {}
+_cursors = {}
+
+
+def _make_key(service, params):
+    payload = json.dumps([service, params], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _load_recordings():
+    if not os.path.exists(store_path):
+        raise ValueError(f"Upstream store not found: {store_path}")
+    with open(store_path, "r", encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            _recordings.setdefault(entry["key"], []).append(entry)
+
+
+def _append_recording(entry):
+    line = json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+    with _lock:
+        with open(store_path, "a", encoding="utf-8") as file:
+            file.write(line + "\n")
+
+
+def _replay(service, key):
+    entries = _recordings.get(key)
+    if not entries:
+        raise Exception(f"No recorded {service} response for this request")
+    # Identical requests are served in the order they were recorded, wrapping around
+    with _lock:
+        index = _cursors.get(key, 0)
+        _cursors[key] = (index + 1) % len(entries)
+    entry = entries[index]
+    if replay_latency:
+        time.sleep(entry.get("elapsed", 0))
+    if "error" in entry:
+        raise Exception(entry["error"])
+    return entry["response"]
+
+
+def upstream_call(service, params, fetch):
+    """
+    Run an upstream request through the configured mode.
+
+    `params` identifies the request and must be JSON serializable (never put
+    secrets in it), `fetch` performs the real call and returns a JSON
+    serializable result. Exceptions raised by `fetch` are recorded and
+    re-raised with the same message on replay.
+    """
+    if mode == "live":
+        return fetch()
+
+    key = _make_key(service, params)
+    if mode == "replay":
+        return _replay(service, key)
+
+    entry = {"key": key, "service": service, "request": params}
+    start = time.perf_counter()
+    try:
+        response = fetch()
+        entry["response"] = response
+        return response
+    except Exception as e:
+        entry["error"] = str(e)
+        raise
+    finally:
+        entry["elapsed"] = round(time.perf_counter() - start, 4)
+        _append_recording(entry)
+
+
+if mode == "replay":
+    _load_recordings()